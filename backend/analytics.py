@@ -0,0 +1,176 @@
+# Population analytics kept up to date in the same transaction as the writes
+# in database.py. Run this module directly to rebuild them from scratch.
+
+COUNTER_USERS = 'users'
+COUNTER_HEALTH_RECORDS = 'health_records'
+
+HISTOGRAM_DISEASE = 'disease'
+HISTOGRAM_BMI_CATEGORY = 'bmi_category'
+HISTOGRAM_DAILY_ASSESSMENTS = 'daily_assessments'
+
+DAILY_ASSESSMENT_DAYS = 30
+
+def init_analytics_tables(cursor):
+    """
+    Create the analytics tables if they don't exist.
+    If they are empty (new database or existing database from before analytics),
+    populate them from the current data.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS analytics_counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS analytics_histograms (
+            histogram TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (histogram, bucket)
+        )
+    ''')
+
+    cursor.execute('SELECT COUNT(*) FROM analytics_counters')
+    if cursor.fetchone()[0] == 0:
+        rebuild_analytics(cursor)
+
+def get_bmi_category_name(bmi):
+    """
+    Classify BMI into a category name.
+    This is the single definition of the BMI thresholds; get_bmi_category in app.py
+    builds on it so the admin histogram matches what users are shown.
+    """
+    if bmi < 18.5:
+        return 'Underweight'
+    elif bmi < 25:
+        return 'Normal'
+    elif bmi < 30:
+        return 'Overweight'
+    else:
+        return 'Obese'
+
+def increment_counter(cursor, name, amount=1):
+    """
+    Add amount to a named counter, creating it if needed.
+    """
+    cursor.execute('''
+        INSERT INTO analytics_counters (name, value) VALUES (?, ?)
+        ON CONFLICT (name) DO UPDATE SET value = value + excluded.value
+    ''', (name, amount))
+
+def increment_histogram(cursor, histogram, bucket, amount=1):
+    """
+    Add amount to one bucket of a histogram, creating the bucket if needed.
+    """
+    cursor.execute('''
+        INSERT INTO analytics_histograms (histogram, bucket, count) VALUES (?, ?, ?)
+        ON CONFLICT (histogram, bucket) DO UPDATE SET count = count + excluded.count
+    ''', (histogram, bucket, amount))
+
+def record_new_user(cursor):
+    """
+    Update analytics for a newly inserted user.
+    Must be called on the cursor that inserted the user, before commit.
+    """
+    increment_counter(cursor, COUNTER_USERS)
+
+def record_new_health_record(cursor, record_id, bmi, predicted_disease):
+    """
+    Update analytics for a newly inserted health record.
+    Must be called on the cursor that inserted the record, before commit.
+    """
+    cursor.execute('SELECT date(created_at) FROM health_records WHERE record_id = ?', (record_id,))
+    created_date = cursor.fetchone()[0]
+
+    increment_counter(cursor, COUNTER_HEALTH_RECORDS)
+    increment_histogram(cursor, HISTOGRAM_DISEASE, predicted_disease or 'Unknown')
+    increment_histogram(cursor, HISTOGRAM_BMI_CATEGORY, get_bmi_category_name(bmi))
+    increment_histogram(cursor, HISTOGRAM_DAILY_ASSESSMENTS, created_date)
+
+def rebuild_analytics(cursor):
+    """
+    Recompute all counters and histograms from the users and health_records tables.
+    """
+    cursor.execute('DELETE FROM analytics_counters')
+    cursor.execute('DELETE FROM analytics_histograms')
+
+    cursor.execute('SELECT COUNT(*) FROM users')
+    increment_counter(cursor, COUNTER_USERS, cursor.fetchone()[0])
+
+    cursor.execute('SELECT COUNT(*) FROM health_records')
+    increment_counter(cursor, COUNTER_HEALTH_RECORDS, cursor.fetchone()[0])
+
+    cursor.execute('''
+        SELECT COALESCE(predicted_disease, 'Unknown'), COUNT(*)
+        FROM health_records
+        GROUP BY 1
+    ''')
+    for disease, count in cursor.fetchall():
+        increment_histogram(cursor, HISTOGRAM_DISEASE, disease, count)
+
+    cursor.execute('SELECT bmi FROM health_records')
+    for (bmi,) in cursor.fetchall():
+        increment_histogram(cursor, HISTOGRAM_BMI_CATEGORY, get_bmi_category_name(bmi))
+
+    cursor.execute('''
+        SELECT date(created_at), COUNT(*)
+        FROM health_records
+        GROUP BY 1
+    ''')
+    for created_date, count in cursor.fetchall():
+        increment_histogram(cursor, HISTOGRAM_DAILY_ASSESSMENTS, created_date, count)
+
+def read_materialized_analytics(cursor):
+    """
+    Read the full contents of the analytics tables, with no limits or filtering.
+    Keys are ('counter', name) or (histogram, bucket).
+    """
+    contents = {}
+    cursor.execute('SELECT name, value FROM analytics_counters')
+    for name, value in cursor.fetchall():
+        contents[('counter', name)] = value
+    cursor.execute('SELECT histogram, bucket, count FROM analytics_histograms')
+    for histogram, bucket, count in cursor.fetchall():
+        contents[(histogram, bucket)] = count
+    return contents
+
+def read_population_stats(cursor):
+    """
+    Read the materialized counters and histograms.
+    Daily assessment volume is limited to the most recent DAILY_ASSESSMENT_DAYS days.
+    """
+    cursor.execute('SELECT name, value FROM analytics_counters')
+    counters = {name: value for name, value in cursor.fetchall()}
+
+    def read_histogram(histogram, order='count DESC', limit=-1):
+        cursor.execute(f'''
+            SELECT bucket, count FROM analytics_histograms
+            WHERE histogram = ? AND count > 0
+            ORDER BY {order}
+            LIMIT ?
+        ''', (histogram, limit))
+        return {bucket: count for bucket, count in cursor.fetchall()}
+
+    return {
+        'total_users': counters.get(COUNTER_USERS, 0),
+        'total_health_records': counters.get(COUNTER_HEALTH_RECORDS, 0),
+        'disease_distribution': read_histogram(HISTOGRAM_DISEASE),
+        'bmi_category_distribution': read_histogram(HISTOGRAM_BMI_CATEGORY),
+        'daily_assessments': read_histogram(HISTOGRAM_DAILY_ASSESSMENTS, 'bucket DESC', DAILY_ASSESSMENT_DAYS)
+    }
+
+if __name__ == '__main__':
+    from database import init_database, get_population_stats, rebuild_population_analytics
+
+    init_database()
+    differences = rebuild_population_analytics()
+
+    if not differences:
+        print("Population analytics are consistent.")
+    else:
+        print("Population analytics were out of date and have been rebuilt:")
+        for (group, key), (before, after) in sorted(differences.items()):
+            print(f"  {group} {key}: {before} -> {after}")
+    print(f"Stats: {get_population_stats()}")
@@ -2,39 +2,108 @@ from flask import Flask, render_template, request, redirect, url_for, session, f
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_caching import Cache
 from flask_compress import Compress
-import pickle
-import numpy as np
 import os
-from database import init_database, create_user, get_user_by_email, get_user_by_id, save_health_record, get_user_health_records, get_user_health_records, get_latest_health_record
+import threading
+import time
+from analytics import get_bmi_category_name
+from database import init_database, create_user, get_user_by_email, get_user_by_id, save_health_record, get_user_health_records, get_user_health_records, get_latest_health_record, get_population_stats
 
-app = Flask(_name_, 
+app = Flask(__name__, 
             template_folder='../public/templates',
             static_folder='../public/static')
 
 app.secret_key = 'your_secret_key_here_change_in_production'
 
+# Comma-separated emails allowed to access admin endpoints
+ADMIN_EMAILS = {email.strip() for email in os.environ.get('ADMIN_EMAILS', '').split(',') if email.strip()}
+
 # Enable Gzip compression for faster responses
 Compress(app)
 
 # Configure caching for performance
 cache = Cache(app, config={'CACHE_TYPE': 'simple', 'CACHE_DEFAULT_TIMEOUT': 300})
 
+# ML startup mode:
+#   eager      - load the model before the server starts (default)
+#   lazy       - load the model on the first prediction
+#   background - start serving immediately and warm the model in a background thread
+ML_STARTUP_MODE = os.environ.get('ML_STARTUP_MODE', 'eager')
+
 model = None
 label_encoders = None
+np = None
+ml_load_finished = False
+ml_load_lock = threading.Lock()
+ml_import_times = {}
 
 def load_ml_model():
     """
     Load the trained machine learning model and label encoders.
+    numpy and sklearn (pulled in by unpickling the model) are imported here
+    rather than at module load, and the time spent on each step is recorded
+    in ml_import_times.
+    """
+    global model, label_encoders, np, ml_load_finished
+    with ml_load_lock:
+        if ml_load_finished:
+            return
+
+        try:
+            start = time.perf_counter()
+            import numpy
+            np = numpy
+            ml_import_times['numpy'] = time.perf_counter() - start
+
+            import pickle
+            start = time.perf_counter()
+            with open('disease_model.pkl', 'rb') as f:
+                loaded_model = pickle.load(f)
+            ml_import_times['disease_model (sklearn)'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open('label_encoders.pkl', 'rb') as f:
+                loaded_encoders = pickle.load(f)
+            ml_import_times['label_encoders'] = time.perf_counter() - start
+
+            label_encoders = loaded_encoders
+            model = loaded_model
+            print("ML model loaded successfully!")
+            print_ml_import_times()
+        except FileNotFoundError:
+            print("Model files not found. Please train the model first by running train_model.py")
+        except Exception as e:
+            print(f"Error loading ML model: {str(e)}")
+        finally:
+            # Only mark the load as done once it has finished, so callers of
+            # ensure_ml_model never see a half-loaded model.
+            ml_load_finished = True
+
+def ensure_ml_model():
     """
-    global model, label_encoders
-    try:
-        with open('disease_model.pkl', 'rb') as f:
-            model = pickle.load(f)
-        with open('label_encoders.pkl', 'rb') as f:
-            label_encoders = pickle.load(f)
-        print("ML model loaded successfully!")
-    except FileNotFoundError:
-        print("Model files not found. Please train the model first by running train_model.py")
+    Make sure the ML model has been loaded, loading it now if needed.
+    Blocks while a background warm-up is still in progress.
+    """
+    if not ml_load_finished:
+        load_ml_model()
+
+def warm_ml_model_in_background():
+    """
+    Load the ML model in a daemon thread so the server can accept
+    connections while the ML stack is being imported.
+    """
+    thread = threading.Thread(target=load_ml_model, name='ml-warmup', daemon=True)
+    thread.start()
+    return thread
+
+def print_ml_import_times():
+    """
+    Print the time spent on each step of loading the ML stack.
+    """
+    total = sum(ml_import_times.values())
+    print("ML import-time breakdown:")
+    for name, seconds in ml_import_times.items():
+        print(f"  {name:<25} {seconds * 1000:8.1f} ms")
+    print(f"  {'total':<25} {total * 1000:8.1f} ms")
 
 def calculate_bmi(height, weight):
     """
@@ -43,23 +112,26 @@ def calculate_bmi(height, weight):
     """
     return round(weight / (height ** 2), 2)
 
+BMI_CATEGORY_DETAILS = {
+    'Underweight': ('Below healthy weight range', 'bmi-underweight'),
+    'Normal': ('Healthy weight range', 'bmi-normal'),
+    'Overweight': ('Above healthy weight range', 'bmi-overweight'),
+    'Obese': ('Significantly above healthy weight range', 'bmi-obese')
+}
+
 def get_bmi_category(bmi):
     """
     Classify BMI into categories and provide descriptions.
     """
-    if bmi < 18.5:
-        return 'Underweight', 'Below healthy weight range', 'bmi-underweight'
-    elif 18.5 <= bmi < 25:
-        return 'Normal', 'Healthy weight range', 'bmi-normal'
-    elif 25 <= bmi < 30:
-        return 'Overweight', 'Above healthy weight range', 'bmi-overweight'
-    else:
-        return 'Obese', 'Significantly above healthy weight range', 'bmi-obese'
+    category = get_bmi_category_name(bmi)
+    description, css_class = BMI_CATEGORY_DETAILS[category]
+    return category, description, css_class
 
 def predict_disease(age, gender, bmi, symptoms, activity_level):
     """
     Predict disease using the trained ML model based on user health data.
     """
+    ensure_ml_model()
     if model is None or label_encoders is None:
         return "Model Not Available"
     
@@ -413,6 +485,21 @@ def user_stats():
         'bmi_trend': bmi_trend
     }
 
+@app.route('/api/admin/population-stats')
+def population_stats():
+    """
+    Admin API endpoint for population-level statistics.
+    Answers from the materialized analytics, without scanning users or health_records.
+    """
+    if 'user_id' not in session:
+        return {'error': 'Not authenticated'}, 401
+    
+    user = get_user_by_id(session['user_id'])
+    if user is None or user['email'] not in ADMIN_EMAILS:
+        return {'error': 'Admin access required'}, 403
+    
+    return get_population_stats()
+
 @app.route('/history')
 def history():
     """
@@ -444,8 +531,22 @@ def history():
                          username=session.get('username'),
                          total_records=len(records_list))
 
-if _name_ == '_main_':
+@app.route('/api/startup-stats')
+def startup_stats():
+    """
+    API endpoint reporting the ML startup mode and import-time breakdown.
+    """
+    return {
+        'ml_startup_mode': ML_STARTUP_MODE,
+        'model_loaded': model is not None,
+        'import_times_ms': {name: round(seconds * 1000, 1) for name, seconds in ml_import_times.items()}
+    }
+
+if __name__ == '__main__':
     init_database()
-    load_ml_model()
+    if ML_STARTUP_MODE == 'eager':
+        load_ml_model()
+    elif ML_STARTUP_MODE == 'background':
+        warm_ml_model_in_background()
     # Disable debug mode in production for speed
-    app.run(debug=False, host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
+    app.run(debug=False, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), threaded=True)
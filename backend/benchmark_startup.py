@@ -0,0 +1,103 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+from http.cookiejar import CookieJar
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+STARTUP_MODES = ['eager', 'lazy', 'background']
+TIMEOUT_SECONDS = 60
+
+def get_free_port():
+    """
+    Ask the OS for an unused TCP port.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def wait_for_first_request(base_url, deadline):
+    """
+    Poll the login page until the server answers with 200.
+    """
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(base_url + '/login', timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.01)
+    raise RuntimeError('Server did not start in time')
+
+def post_form(opener, url, data):
+    """
+    POST form data and return the final URL after redirects and the response body.
+    """
+    body = urllib.parse.urlencode(data, doseq=True).encode()
+    with opener.open(url, data=body, timeout=TIMEOUT_SECONDS) as response:
+        return response.geturl(), response.read().decode()
+
+def benchmark_mode(mode):
+    """
+    Start app.py in the given ML startup mode and measure time-to-first-request
+    and time-to-first-prediction, both from process launch.
+    """
+    port = get_free_port()
+    base_url = f'http://127.0.0.1:{port}'
+    db_fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(db_fd)
+
+    env = dict(os.environ, PORT=str(port), DATABASE_NAME=db_path, ML_STARTUP_MODE=mode)
+    start = time.time()
+    process = subprocess.Popen(
+        [sys.executable, 'app.py'], cwd=BACKEND_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_first_request(base_url, start + TIMEOUT_SECONDS)
+        first_request = time.time() - start
+
+        opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+        credentials = {'email': 'bench@example.com', 'password': 'benchmark'}
+        post_form(opener, base_url + '/signup', dict(credentials, username='bench'))
+        post_form(opener, base_url + '/login', credentials)
+        final_url, page = post_form(opener, base_url + '/predict', {
+            'age': 35, 'gender': 'male', 'height': 1.75, 'weight': 70,
+            'symptoms': ['fever', 'cough'], 'activity_level': 'medium'
+        })
+        first_prediction = time.time() - start
+        if not final_url.endswith('/predict'):
+            raise RuntimeError(f'Prediction failed, redirected to {final_url}')
+        if 'Model Not Available' in page:
+            raise RuntimeError('Prediction did not run the model')
+
+        with urllib.request.urlopen(base_url + '/api/startup-stats', timeout=TIMEOUT_SECONDS) as response:
+            stats = json.load(response)
+        if not stats['model_loaded']:
+            raise RuntimeError('Model was not loaded after the first prediction')
+    finally:
+        process.terminate()
+        process.wait()
+        os.remove(db_path)
+
+    return first_request, first_prediction, stats
+
+def main():
+    """
+    Run the startup benchmark for every ML startup mode and print a summary.
+    """
+    modes = sys.argv[1:] or STARTUP_MODES
+    print(f"{'mode':<12} {'first request':>15} {'first prediction':>18}")
+    for mode in modes:
+        first_request, first_prediction, stats = benchmark_mode(mode)
+        print(f"{mode:<12} {first_request * 1000:12.1f} ms {first_prediction * 1000:15.1f} ms")
+        for name, ms in stats['import_times_ms'].items():
+            print(f"    {name:<25} {ms:8.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
+import os
 import sqlite3
 from datetime import datetime
+from analytics import init_analytics_tables, record_new_user, record_new_health_record, rebuild_analytics, read_materialized_analytics, read_population_stats
 
-DATABASE_NAME = 'users.db'
+DATABASE_NAME = os.environ.get('DATABASE_NAME', 'users.db')
 
 def init_database():
     """
@@ -37,6 +39,8 @@ def init_database():
         )
     ''')
     
+    init_analytics_tables(cursor)
+    
     conn.commit()
     conn.close()
     print("Database initialized successfully!")
@@ -54,18 +58,21 @@ def create_user(username, email, hashed_password):
     Insert a new user into the users table.
     Returns the user ID if successful, None if email already exists.
     """
+    conn = get_db_connection()
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         cursor.execute(
             'INSERT INTO users (username, email, password) VALUES (?, ?, ?)',
             (username, email, hashed_password)
         )
-        conn.commit()
         user_id = cursor.lastrowid
+        record_new_user(cursor)
+        conn.commit()
         conn.close()
         return user_id
     except sqlite3.IntegrityError:
+        conn.rollback()
+        conn.close()
         return None
 
 def get_user_by_email(email):
@@ -104,8 +111,9 @@ def save_health_record(user_id, age, gender, height, weight, bmi, symptoms, acti
         (user_id, age, gender, height, weight, bmi, symptoms, activity_level, predicted_disease)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
     ''', (user_id, age, gender, height, weight, bmi, symptoms, activity_level, predicted_disease))
-    conn.commit()
     record_id = cursor.lastrowid
+    record_new_health_record(cursor, record_id, bmi, predicted_disease)
+    conn.commit()
     conn.close()
     return record_id
 
@@ -140,5 +148,33 @@ def get_latest_health_record(user_id):
     conn.close()
     return record
 
-if _name_ == '_main_':
+def get_population_stats():
+    """
+    Retrieve population-level totals and distributions from the materialized analytics.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    stats = read_population_stats(cursor)
+    conn.close()
+    return stats
+
+def rebuild_population_analytics():
+    """
+    Recompute the materialized analytics from the users and health_records tables.
+    Returns the entries that differed as {key: (before, after)}; empty if consistent.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    before = read_materialized_analytics(cursor)
+    rebuild_analytics(cursor)
+    after = read_materialized_analytics(cursor)
+    conn.commit()
+    conn.close()
+    differences = {}
+    for key in before.keys() | after.keys():
+        if before.get(key) != after.get(key):
+            differences[key] = (before.get(key), after.get(key))
+    return differences
+
+if __name__ == '__main__':
     init_database()
\ No newline at end of file
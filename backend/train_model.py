@@ -1,15 +1,16 @@
-import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
 import pickle
 
+# numpy, pandas and sklearn are imported inside the functions that use them
+# so importing this module stays cheap.
+
 def create_sample_dataset():
     """
     Create a sample dataset for training the disease prediction model.
     In production, you would use a real medical dataset.
     """
+    import numpy as np
+    import pandas as pd
+
     np.random.seed(42)
     
     n_samples = 1000
@@ -58,6 +59,10 @@ def train_model():
     Train a Random Forest classifier to predict diseases based on health data.
     Saves the trained model and encoders to pickle files.
     """
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import LabelEncoder
+
     print("Creating sample dataset...")
     df = create_sample_dataset()
     
@@ -103,5 +108,5 @@ def train_model():
     
     return model, le_gender, le_activity, le_disease
 
-if _name_ == '_main_':
+if __name__ == '__main__':
     train_model()
\ No newline at end of file